@@ -54,13 +54,16 @@ class UniversalATSChecker:
             '.gif': 15
         }
    
-    def extract_text_from_file(self, file_path: str) -> str:
+    def extract_text_from_file(self, file_path: str, file_info: Dict = None) -> str:
+        """Extract resume text; the PDF page count is recorded in `file_info` if given"""
         try:
             if file_path.lower().endswith('.pdf'):
                 try:
                     import pdfplumber
                     text = ""
                     with pdfplumber.open(file_path) as pdf:
+                        if file_info is not None:
+                            file_info['pages'] = len(pdf.pages)
                         for page in pdf.pages:
                             page_text = page.extract_text() or ""
                             text += page_text
@@ -95,19 +98,42 @@ class UniversalATSChecker:
 
         except Exception as e:
             return f"Error reading file: {str(e)}"
-   
-    def check_contact_information(self, text: str) -> Dict:
-        score = 0
-        found_elements = []
-        missing_elements = []
 
+    def split_into_sections(self, text: str) -> List[str]:
+        """Split resume text into sections on heading lines.
+
+        Joining the returned sections with newlines gives back the original text.
+        """
+        sections = []
+        current = []
+        for line in text.split('\n'):
+            if current and self._is_section_heading(line):
+                sections.append('\n'.join(current))
+                current = []
+            current.append(line)
+        sections.append('\n'.join(current))
+        return sections
+
+    def _is_section_heading(self, line: str) -> bool:
+        words = line.strip().strip(':').lower().split()
+        if not words or len(words) > 4:
+            return False
+        return any(keyword in words
+                   for keywords in self.essential_sections.values()
+                   for keyword in keywords)
+
+    def analyze_section(self, text: str) -> Dict:
+        """Collect the per-section signals the ATS checks are scored from"""
+        return {
+            'contact': self._contact_signals(text),
+            'sections': self._sections_signals(text),
+            'content': self._content_signals(text),
+            'formatting': self._formatting_signals(text)
+        }
+
+    def _contact_signals(self, text: str) -> Dict:
         # Email pattern
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        if re.search(email_pattern, text):
-            score += 25
-            found_elements.append('Email')
-        else:
-            missing_elements.append('Email address')
 
         # Phone pattern (various formats)
         phone_patterns = [
@@ -115,38 +141,59 @@ class UniversalATSChecker:
             r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
             r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}'
         ]
-        phone_found = any(re.search(pattern, text) for pattern in phone_patterns)
-        if phone_found:
+
+        # Improved LinkedIn pattern
+        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
+
+        # Address/Location (city, state)
+        location_patterns = [
+            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
+            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+,\s*[A-Z]{2}\b'
+        ]
+
+        return {
+            'email': bool(re.search(email_pattern, text)),
+            'phone': any(re.search(pattern, text) for pattern in phone_patterns),
+            'linkedin': bool(re.search(linkedin_pattern, text.lower())),
+            'location': any(re.search(pattern, text) for pattern in location_patterns),
+            'name': self._has_name(text)
+        }
+
+    def _has_name(self, text: str) -> bool:
+        # Name detection from top lines
+        lines = text.strip().split('\n')[:3]
+        return any(len(line.split()) >= 2 and
+                   all(word.replace('-', '').replace("'", "").isalpha()
+                       for word in line.split()[:3]) for line in lines)
+
+    def _score_contact(self, signals: Dict) -> Dict:
+        score = 0
+        found_elements = []
+        missing_elements = []
+
+        if signals['email']:
+            score += 25
+            found_elements.append('Email')
+        else:
+            missing_elements.append('Email address')
+
+        if signals['phone']:
             score += 20
             found_elements.append('Phone')
         else:
             missing_elements.append('Phone number')
 
-        # Improved LinkedIn pattern
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-
-        if re.search(linkedin_pattern, text.lower()):
+        if signals['linkedin']:
             score += 15
             found_elements.append('LinkedIn')
         else:
             missing_elements.append('LinkedIn profile')
 
-        # Address/Location (city, state)
-        location_patterns = [
-            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
-            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+,\s*[A-Z]{2}\b'
-        ]
-        location_found = any(re.search(pattern, text) for pattern in location_patterns)
-        if location_found:
+        if signals['location']:
             score += 10
             found_elements.append('Location')
 
-        # Name detection from top lines
-        lines = text.strip().split('\n')[:3]
-        name_found = any(len(line.split()) >= 2 and
-                        all(word.replace('-', '').replace("'", "").isalpha()
-                            for word in line.split()[:3]) for line in lines)
-        if name_found:
+        if signals['name']:
             score += 30
             found_elements.append('Name')
         else:
@@ -158,45 +205,46 @@ class UniversalATSChecker:
             'missing_elements': missing_elements
         }
 
-   
-    def check_resume_sections(self, text: str) -> Dict:
-        """Check for essential resume sections"""
+    def check_contact_information(self, text: str) -> Dict:
+        return self._score_contact(self._contact_signals(text))
+
+    def _sections_signals(self, text: str) -> List[str]:
         text_lower = text.lower()
+        return [section_name for section_name, keywords in self.essential_sections.items()
+                if any(keyword in text_lower for keyword in keywords)]
+
+    def _score_sections(self, found: List[str]) -> Dict:
         score = 0
         found_sections = []
         missing_sections = []
-       
-        for section_name, keywords in self.essential_sections.items():
-            section_found = any(keyword in text_lower for keyword in keywords)
-            if section_found:
+
+        for section_name in self.essential_sections:
+            if section_name in found:
                 score += 20
                 found_sections.append(section_name.title())
             else:
                 missing_sections.append(section_name.title())
-       
+
         return {
             'sections_score': score,
             'found_sections': found_sections,
             'missing_sections': missing_sections
         }
-   
-    def check_content_quality(self, text: str) -> Dict:
-        score = 100
-        issues = []
-        strengths = []
 
-        words = text.split()
-        word_count = len(words)
+    def check_resume_sections(self, text: str) -> Dict:
+        """Check for essential resume sections"""
+        return self._score_sections(self._sections_signals(text))
 
-        if word_count < 200:
-            score -= 20
-            issues.append("Resume is too short (under 200 words)")
-        elif word_count > 2000:
-            score -= 10
-            issues.append("Resume may be too long (over 2000 words)")
-        else:
-            strengths.append(f"Good length ({word_count} words)")
+    def _content_signals(self, text: str) -> Dict:
+        text_lower = text.lower()
+
+        return {
+            'word_count': len(text.split()),
+            'action_verbs': [verb for verb in self.action_verbs if verb in text_lower],
+            'special_chars': len(re.findall(r'[^\w\s.-]', text))
+        }
 
+    def _sentence_signals(self, text: str) -> Dict:
         # Enhanced quantified achievement detection
         quantified_achievements = 0
         sentences = sent_tokenize(text)
@@ -216,7 +264,35 @@ class UniversalATSChecker:
             if any(verb in sentence_lower for verb in impact_keywords) and re.search(number_regex, sentence_lower):
                 quantified_achievements += 1
 
+        return {
+            'quantified_achievements': quantified_achievements,
+            'sentence_count': len(sentences),
+            'sentence_words': sum(len(s.split()) for s in sentences)
+        }
+
+    def _readability(self, text: str):
+        try:
+            return textstat.flesch_reading_ease(text)
+        except:
+            return "Unable to calculate"
+
+    def _score_content(self, signals: Dict, readability, text_length: int) -> Dict:
+        score = 100
+        issues = []
+        strengths = []
+
+        word_count = signals['word_count']
+
+        if word_count < 200:
+            score -= 20
+            issues.append("Resume is too short (under 200 words)")
+        elif word_count > 2000:
+            score -= 10
+            issues.append("Resume may be too long (over 2000 words)")
+        else:
+            strengths.append(f"Good length ({word_count} words)")
 
+        quantified_achievements = signals['quantified_achievements']
         if quantified_achievements >= 3:
             strengths.append("Contains quantified achievements")
         elif quantified_achievements >= 1:
@@ -227,8 +303,7 @@ class UniversalATSChecker:
             issues.append("Lacks quantified achievements (numbers, percentages)")
 
         # Action verbs check
-        text_lower = text.lower()
-        action_verb_count = sum(1 for verb in self.action_verbs if verb in text_lower)
+        action_verb_count = len(signals['action_verbs'])
 
         if action_verb_count >= 5:
             strengths.append("Uses strong action verbs")
@@ -240,8 +315,7 @@ class UniversalATSChecker:
             issues.append("Lacks strong action verbs")
 
         # Readability
-        try:
-            readability = textstat.flesch_reading_ease(text)
+        if not isinstance(readability, str):
             if readability >= 60:
                 strengths.append("Good readability score")
             elif readability >= 30:
@@ -250,18 +324,15 @@ class UniversalATSChecker:
             else:
                 score -= 10
                 issues.append("Text is difficult to read")
-        except:
-            readability = "Unable to calculate"
 
         # Excessive special characters
-        special_chars = len(re.findall(r'[^\w\s.-]', text))
-        if special_chars / len(text) > 0.1:
+        if signals['special_chars'] / text_length > 0.1:
             score -= 15
             issues.append("May contain excessive special characters/formatting")
 
         # Sentence structure
-        sentences = sent_tokenize(text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
+        sentence_count = signals['sentence_count']
+        avg_sentence_length = signals['sentence_words'] / sentence_count if sentence_count else 0
 
         if avg_sentence_length > 25:
             score -= 5
@@ -280,18 +351,32 @@ class UniversalATSChecker:
             'strengths': strengths
         }
 
-   
-    def check_formatting_compatibility(self, text: str, filename: str = "") -> Dict:
-        """Check formatting for ATS compatibility"""
+    def check_content_quality(self, text: str) -> Dict:
+        signals = self._content_signals(text)
+        signals.update(self._sentence_signals(text))
+        return self._score_content(signals, self._readability(text), len(text))
+
+    def _formatting_signals(self, text: str) -> Dict:
+        # Check for tables/columns (indicated by excessive spacing)
+        lines = text.split('\n')
+        return {
+            'line_count': len(lines),
+            'complex_lines': sum(1 for line in lines if '\t' in line or '  ' * 3 in line),
+            'unusual_chars': len(re.findall(r'[^\w\s.,;:()\-@/]', text)),
+            'double_spaces': text.count('  '),
+            'word_count': len(text.split())
+        }
+
+    def _score_formatting(self, signals: Dict, filename: str = "") -> Dict:
         score = 100
         issues = []
         recommendations = []
-       
+
         # File format check
         if filename:
             file_ext = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
             format_score = self.format_scores.get(file_ext, 50)
-           
+
             if format_score < 70:
                 issues.append(f"File format {file_ext} may not be ATS-friendly")
                 recommendations.append("Use PDF or DOCX format")
@@ -299,45 +384,81 @@ class UniversalATSChecker:
                 pass  # No issues
             else:
                 recommendations.append("PDF or DOCX formats are more ATS-friendly")
-       
-        # Check for tables/columns (indicated by excessive spacing)
-        lines = text.split('\n')
-        complex_formatting = sum(1 for line in lines if '\t' in line or '  ' * 3 in line)
-       
-        if complex_formatting > len(lines) * 0.3:
+
+        if signals['complex_lines'] > signals['line_count'] * 0.3:
             score -= 15
             issues.append("May contain complex formatting (tables/columns)")
             recommendations.append("Use simple formatting without tables")
-       
+
         # Check for unusual characters
-        unusual_chars = re.findall(r'[^\w\s.,;:()\-@/]', text)
-        if len(unusual_chars) > 10:
+        if signals['unusual_chars'] > 10:
             score -= 10
             issues.append("Contains unusual characters that may cause parsing issues")
             recommendations.append("Remove special symbols and fancy formatting")
-       
+
         # Check for proper spacing
-        double_spaces = text.count('  ')
-        if double_spaces > len(text.split()) * 0.1:
+        if signals['double_spaces'] > signals['word_count'] * 0.1:
             score -= 5
             issues.append("Inconsistent spacing detected")
             recommendations.append("Use consistent single spacing")
-       
+
         return {
             'formatting_score': max(0, score),
             'issues': issues,
             'recommendations': recommendations
         }
-   
+
+    def check_formatting_compatibility(self, text: str, filename: str = "") -> Dict:
+        """Check formatting for ATS compatibility"""
+        return self._score_formatting(self._formatting_signals(text), filename)
+
     def calculate_overall_ats_score(self, resume_text: str, filename: str = "") -> Dict:
         """Calculate comprehensive ATS score for any resume"""
-       
+
         # Run all checks
         contact_results = self.check_contact_information(resume_text)
         sections_results = self.check_resume_sections(resume_text)
         content_results = self.check_content_quality(resume_text)
         formatting_results = self.check_formatting_compatibility(resume_text, filename)
-       
+
+        return self._combine_results(contact_results, sections_results, content_results, formatting_results)
+
+    def calculate_ats_score_from_sections(self, resume_text: str, section_signals: List[Dict],
+                                          filename: str = "") -> Dict:
+        """Calculate the ATS score from per-section signals (see analyze_section).
+
+        Counts are summed and presence flags OR-ed across sections. The name
+        (top lines), readability and the sentence-based signals (quantified
+        achievements, sentence length) are whole-document measures, so they
+        are taken from the full text.
+        """
+        contact = {key: any(s['contact'][key] for s in section_signals)
+                   for key in ('email', 'phone', 'linkedin', 'location')}
+        contact['name'] = self._has_name(resume_text)
+
+        found_sections = {name for s in section_signals for name in s['sections']}
+
+        content = {
+            'word_count': sum(s['content']['word_count'] for s in section_signals),
+            'action_verbs': sorted({verb for s in section_signals for verb in s['content']['action_verbs']}),
+            'special_chars': sum(s['content']['special_chars'] for s in section_signals)
+        }
+        # punkt does not split on newlines, so sentences run across section
+        # headings; sentence-based signals are taken from the full text
+        content.update(self._sentence_signals(resume_text))
+
+        formatting = {key: sum(s['formatting'][key] for s in section_signals)
+                      for key in ('line_count', 'complex_lines', 'unusual_chars', 'double_spaces', 'word_count')}
+
+        return self._combine_results(
+            self._score_contact(contact),
+            self._score_sections(found_sections),
+            self._score_content(content, self._readability(resume_text), len(resume_text)),
+            self._score_formatting(formatting, filename)
+        )
+
+    def _combine_results(self, contact_results: Dict, sections_results: Dict,
+                         content_results: Dict, formatting_results: Dict) -> Dict:
         # Calculate weighted overall score
         # Contact Info: 25%, Sections: 25%, Content Quality: 35%, Formatting: 15%
         overall_score = (
@@ -346,7 +467,7 @@ class UniversalATSChecker:
             (content_results['content_score'] * 0.35) +
             (formatting_results['formatting_score'] * 0.15)
         )
-       
+
         # Compile all recommendations
         all_recommendations = []
        
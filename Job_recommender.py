@@ -5,12 +5,14 @@ import requests
 import spacy
 import os
 import re
+from job_dedup import deduplicate_jobs
 
 
 nlp = spacy.load('en_core_web_sm')
 
 
-API_HOST = 'https://api.openwebninja.com/jsearch'
+# Overridable so the app can be pointed at a stub server (see loadtest.py)
+API_HOST = os.environ.get('JSEARCH_API_HOST', 'https://api.openwebninja.com/jsearch')
 
 SKILLS_DB = [
     'python', 'java', 'c++', 'c#', 'javascript', 'html', 'css', 'sql', 'mysql',
@@ -70,28 +72,25 @@ def extract_experience(text):
                 
     return experience_years
 
-def search_jobs(skills, experience_years, api_key=None):
-    """Searches for jobs on JSearch API based on skills and experience."""
-    if not skills:
-        return None
-
-    if not api_key:
-        print("API key not provided for job search.")
-        return None
-
-    # Select one skill from java, python, sql if available
-    target_skills = ['java', 'python', 'sql']
-    available_target_skills = [skill for skill in skills if skill.lower() in target_skills]
-
-    if available_target_skills:
-        selected_skill = available_target_skills[0]  # Select the first available
-        query = f"{selected_skill} jobs"
-    else:
-        query = " ".join(skills) + " jobs"
-
+# Skills that get a single-skill query; anything else searches on all skills
+TARGET_SKILLS = ['java', 'python', 'sql']
+
+def build_job_query(skills):
+    """Builds the JSearch query string for a list of skills."""
+    # Select one skill from java, python, sql if available, in TARGET_SKILLS order
+    # so the choice does not depend on the order skills were extracted in
+    lowered = {skill.lower() for skill in skills}
+    selected_skill = next((target for target in TARGET_SKILLS if target in lowered), None)
+    if selected_skill:
+        return f"{selected_skill} jobs"
+    # Sorted so the same skill set always gives the same (cacheable) query
+    return " ".join(sorted(skills)) + " jobs"
+
+def fetch_jobs(query, api_key):
+    """Fetches job postings for a query from the JSearch API."""
     print(f"\nSearching for jobs with query: '{query}'\n")
 
-    url = "https://api.openwebninja.com/jsearch/search"
+    url = f"{API_HOST}/search"
     headers = {
         "x-api-key": api_key
     }
@@ -105,7 +104,9 @@ def search_jobs(skills, experience_years, api_key=None):
         response.raise_for_status()
         data = response.json()
         print("Full API response:", data)
-        return data.get('data')
+        jobs = data.get('data')
+        # The same job is often reposted by several boards across the pages
+        return deduplicate_jobs(jobs) if jobs else jobs
     except requests.exceptions.HTTPError as e:
         print(f"HTTP Error fetching jobs: {e}")
         try:
@@ -117,6 +118,26 @@ def search_jobs(skills, experience_years, api_key=None):
         print(f"A network error occurred: {e}")
         return None
 
+def search_jobs(skills, experience_years, api_key=None, cache=None, related_skills=None):
+    """Searches for jobs on JSearch API based on skills and experience."""
+    if not skills:
+        return None
+
+    if not api_key:
+        print("API key not provided for job search.")
+        return None
+
+    def run_query(query):
+        if cache is not None:
+            return cache.get(query, api_key)
+        return fetch_jobs(query, api_key)
+
+    jobs = run_query(build_job_query(skills))
+    # Broaden to the closest related skill only when the resume's own skills find nothing
+    if jobs == [] and related_skills:
+        jobs = run_query(build_job_query(related_skills[:1]))
+    return jobs
+
 def main():
    
     pdf_path = input("Enter the path to your resume PDF: ")
@@ -1,8 +1,13 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
 import os
+import uuid
 from werkzeug.utils import secure_filename
 from Ats import UniversalATSChecker
-from Job_recommender import extract_skills, extract_experience, search_jobs
+from Job_recommender import search_jobs
+from job_cache import JobSearchCache
+from section_cache import SectionCache
+from profiler import RequestProfiler
+from skill_model import SkillCooccurrenceModel
 import re
 
 app = Flask(__name__)
@@ -10,6 +15,17 @@ app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['JSEARCH_API_KEY'] = 'ak_jiti1d0u7bjjhqpr138j6jp7yc23js47zstuc2i8756hosr'
+app.config['SKILL_MODEL_DIR'] = os.environ.get('SKILL_MODEL_DIR', os.path.join('models', 'skills'))
+
+# Opt-in profiling of slow /analyze requests (see profiler.py)
+app.config['PROFILE_ENABLED'] = os.environ.get('PROFILE_ENABLED') == '1'
+app.config['PROFILE_SAMPLE_RATE'] = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+app.config['PROFILE_SLOW_THRESHOLD'] = float(os.environ['PROFILE_SLOW_THRESHOLD']) if 'PROFILE_SLOW_THRESHOLD' in os.environ else None
+app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR', 'profiles')
+app.config['PROFILE_MAX_FILES'] = int(os.environ.get('PROFILE_MAX_FILES', 100))
+app.config['PROFILE_HEADER'] = os.environ.get('PROFILE_HEADER', 'X-Profile-Request')
+app.config['PROFILE_ALLOW_HEADER'] = os.environ.get('PROFILE_ALLOW_HEADER') == '1'
+request_profiler = RequestProfiler(app)
 
 # Ensure upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -17,6 +33,22 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 # Initialize ATS checker
 ats_checker = UniversalATSChecker()
 
+# Reuses per-section results when a resume is re-uploaded in the same session
+section_cache = SectionCache(ats_checker)
+
+# Caches job search results. The opt-in warmer (JOB_CACHE_WARMER=1) keeps
+# recently requested popular queries fresh so requests rarely wait on the JSearch API.
+# JOB_CACHE=0 bypasses the cache, e.g. to load test against upstream latency.
+job_cache = JobSearchCache() if os.environ.get('JOB_CACHE', '1') == '1' else None
+if job_cache and os.environ.get('JOB_CACHE_WARMER', '0') == '1' and app.config['JSEARCH_API_KEY'] != 'YOUR_RAPIDAPI_KEY':
+    job_cache.start(app.config['JSEARCH_API_KEY'])
+
+# Related-skill model trained offline with `python skill_model.py <postings>`
+try:
+    skill_model = SkillCooccurrenceModel.load(app.config['SKILL_MODEL_DIR'])
+except FileNotFoundError:
+    skill_model = None
+
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt'}
 
 def allowed_file(filename):
@@ -43,25 +75,35 @@ def analyze():
         file.save(filepath)
 
         # Extract text from uploaded file
-        resume_text = ats_checker.extract_text_from_file(filepath)
+        file_info = {}
+        resume_text = ats_checker.extract_text_from_file(filepath, file_info)
+
+        if request_profiler.active():
+            request_profiler.annotate(file_type=file.filename.rsplit('.', 1)[1].lower(),
+                                      file_size=os.path.getsize(filepath),
+                                      pages=file_info.get('pages'))
 
         if "Error reading file" in resume_text:
             flash('Error reading the file. Please try a different format.')
             os.remove(filepath)
             return redirect(url_for('home'))
 
-        # Perform ATS analysis
-        ats_results = ats_checker.calculate_overall_ats_score(resume_text, filename)
+        # Perform ATS analysis, extracting skills and experience for job recommendations.
+        # Sections unchanged since the last upload in this session are not re-analysed.
+        if 'analysis_id' not in session:
+            session['analysis_id'] = uuid.uuid4().hex
+        analysis = section_cache.analyze(session['analysis_id'], resume_text, filename)
+        ats_results = analysis['ats_results']
         ats_report = ats_checker.generate_detailed_report(ats_results)
-
-        # Extract skills and experience for job recommendations
-        skills = extract_skills(resume_text)
-        experience = extract_experience(resume_text)
+        skills = analysis['skills']
+        experience = analysis['experience']
+        suggested_skills = [skill for skill, _ in skill_model.related(skills)] if skill_model and skills else []
 
         # Search for jobs
         if skills:
             if app.config['JSEARCH_API_KEY'] != 'YOUR_RAPIDAPI_KEY':
-                jobs_data = search_jobs(skills, experience, app.config['JSEARCH_API_KEY'])
+                jobs_data = search_jobs(skills, experience, app.config['JSEARCH_API_KEY'], cache=job_cache,
+                                        related_skills=suggested_skills)
                 if jobs_data:
                     jobs = jobs_data[:10]
                 else:
@@ -80,12 +122,19 @@ def analyze():
                              ats_report=ats_report,
                              skills=skills,
                              experience=experience,
+                             suggested_skills=suggested_skills,
                              jobs=jobs)
 
     else:
         flash('Invalid file type. Please upload PDF, DOCX, DOC, or TXT files.')
         return redirect(url_for('home'))
 
+@app.route('/stats/job-cache')
+def job_cache_stats():
+    if job_cache is None:
+        return jsonify({'enabled': False})
+    return jsonify(job_cache.stats())
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
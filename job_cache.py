@@ -0,0 +1,171 @@
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+from Job_recommender import fetch_jobs
+
+
+class JobSearchCache:
+    """TTL cache of JSearch results with an optional background warmer.
+
+    Almost every resume maps to one of a handful of queries, so the cache
+    tracks how popular each query is (a request count that decays with
+    `half_life`) and a background thread refreshes the most popular ones
+    shortly before they expire. Only queries requested within the last TTL
+    are refreshed, so an idle cache stops spending API quota. The number of
+    upstream API calls is counted so quota usage can be reported.
+
+    Each process (e.g. each gunicorn worker) holds its own cache and warmer.
+    """
+
+    def __init__(self, ttl: float = 3600, refresh_margin: float = 300, top_n: int = 5,
+                 interval: float = 60, half_life: float = 1800):
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self.top_n = top_n
+        self.interval = interval
+        self.half_life = half_life
+        self._entries = {}
+        # query -> fetch in progress; concurrent callers wait for it instead of calling the API
+        self._in_flight = {}
+        # query -> (decayed request count, time of the last request)
+        self._popularity = {}
+        self._stats = Counter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _score(self, query: str, now: float) -> float:
+        score, last_requested = self._popularity[query]
+        return score * 0.5 ** ((now - last_requested) / self.half_life)
+
+    def get(self, query: str, api_key: str):
+        """Return cached results for a query, fetching them on a miss"""
+        now = time.time()
+        with self._lock:
+            score = self._score(query, now) if query in self._popularity else 0.0
+            self._popularity[query] = (score + 1, now)
+            entry = self._entries.get(query)
+            if entry is not None and now < entry['expires']:
+                self._stats['hits'] += 1
+                return entry['jobs']
+            self._stats['misses'] += 1
+
+            # Only one caller fetches a query at a time; the others wait for its result
+            flight = self._in_flight.get(query)
+            leader = flight is None
+            if leader:
+                flight = self._start_fetch(query)
+            else:
+                self._stats['coalesced'] += 1
+
+        if leader:
+            jobs = self._fetch(query, api_key, 'request_api_calls', flight)
+        else:
+            flight['done'].wait()
+            jobs = flight['jobs']
+
+        if jobs is None:
+            # The fetch failed; expired results beat showing no jobs at all
+            with self._lock:
+                entry = self._entries.get(query)
+                if entry is not None:
+                    self._stats['stale_served'] += 1
+                    return entry['jobs']
+        return jobs
+
+    def _start_fetch(self, query: str) -> Dict:
+        # Called with the lock held
+        flight = {'done': threading.Event(), 'jobs': None}
+        self._in_flight[query] = flight
+        return flight
+
+    def _fetch(self, query: str, api_key: str, counter: str, flight: Dict):
+        jobs = None
+        try:
+            jobs = fetch_jobs(query, api_key)
+        finally:
+            with self._lock:
+                self._stats[counter] += 1
+                # Failed fetches are not cached so the next request retries
+                if jobs is not None:
+                    self._entries[query] = {'jobs': jobs, 'expires': time.time() + self.ttl}
+                flight['jobs'] = jobs
+                del self._in_flight[query]
+            flight['done'].set()
+        return jobs
+
+    def _is_due(self, query: str, now: float) -> bool:
+        return (query not in self._in_flight
+                and (query not in self._entries
+                     or self._entries[query]['expires'] - now <= self.refresh_margin))
+
+    def _popular_queries(self, now: float) -> List[str]:
+        # Forget queries nobody asked for within the TTL, and their expired results
+        for query, (_, last_requested) in list(self._popularity.items()):
+            if now - last_requested > self.ttl:
+                del self._popularity[query]
+        for query, entry in list(self._entries.items()):
+            if entry['expires'] <= now and query not in self._popularity:
+                del self._entries[query]
+
+        ranked = sorted(self._popularity, key=lambda query: self._score(query, now), reverse=True)
+        return ranked[:self.top_n]
+
+    def warm(self, api_key: str) -> int:
+        """Refresh recently requested popular queries that are missing or about to expire"""
+        with self._lock:
+            candidates = self._popular_queries(time.time())
+
+        refreshed = 0
+        for query in candidates:
+            if self._stop_event.is_set():
+                break
+            with self._lock:
+                # A request may have fetched or started fetching it meanwhile
+                if not self._is_due(query, time.time()):
+                    continue
+                flight = self._start_fetch(query)
+            self._fetch(query, api_key, 'warmer_api_calls', flight)
+            refreshed += 1
+        return refreshed
+
+    def start(self, api_key: str):
+        """Start the background warmer thread"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, args=(api_key,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, api_key: str):
+        while not self._stop_event.is_set():
+            try:
+                self.warm(api_key)
+            except Exception as e:
+                print(f"Job cache warmer error: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stats(self) -> Dict:
+        now = time.time()
+        with self._lock:
+            requests_served = self._stats['hits'] + self._stats['misses']
+            return {
+                'hits': self._stats['hits'],
+                'misses': self._stats['misses'],
+                'hit_rate': round(self._stats['hits'] / requests_served, 3) if requests_served else None,
+                'coalesced': self._stats['coalesced'],
+                'stale_served': self._stats['stale_served'],
+                'request_api_calls': self._stats['request_api_calls'],
+                'warmer_api_calls': self._stats['warmer_api_calls'],
+                'total_api_calls': self._stats['request_api_calls'] + self._stats['warmer_api_calls'],
+                'cached_queries': len(self._entries),
+                'top_queries': [(query, round(self._score(query, now), 2))
+                                for query in self._popular_queries(now)]
+            }
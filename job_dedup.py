@@ -0,0 +1,95 @@
+import re
+import zlib
+from typing import Dict, List
+
+import numpy as np
+
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) mod p
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+
+# Upper bound on shingles hashed at once, keeps the (num_perm x shingles) block small
+CHUNK_SHINGLES = 32768
+
+
+def job_shingles(job: Dict, size: int = 3) -> np.ndarray:
+    """Hash the word shingles of a posting's title, employer and description"""
+    text = ' '.join(str(job.get(field) or '') for field in ('job_title', 'employer_name', 'job_description'))
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    if len(words) < size:
+        shingles = {' '.join(words)} if words else set()
+    else:
+        shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return np.array([zlib.crc32(s.encode('utf-8')) for s in shingles], dtype=np.uint64)
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        # a < 2^31 and x < 2^32 keep a * x + b within uint64
+        self.a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)[:, None]
+        self.b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)[:, None]
+        self.num_perm = num_perm
+
+    def signatures(self, shingle_sets: List[np.ndarray]) -> np.ndarray:
+        """MinHash signatures, one row per (non-empty) shingle set"""
+        signatures = np.empty((len(shingle_sets), self.num_perm), dtype=np.uint64)
+        start = 0
+        while start < len(shingle_sets):
+            # Group documents so each chunk hashes a bounded number of shingles
+            end = start + 1
+            total = len(shingle_sets[start])
+            while end < len(shingle_sets) and total + len(shingle_sets[end]) <= CHUNK_SHINGLES:
+                total += len(shingle_sets[end])
+                end += 1
+
+            chunk = shingle_sets[start:end]
+            values = np.concatenate(chunk)
+            offsets = np.cumsum([0] + [len(s) for s in chunk[:-1]])
+            hashed = ((self.a * values[None, :] + self.b) % MERSENNE_PRIME) & MAX_HASH
+            signatures[start:end] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = end
+        return signatures
+
+
+def deduplicate_jobs(jobs: List[Dict], threshold: float = 0.8, num_perm: int = 128,
+                     bands: int = 16) -> List[Dict]:
+    """Drop near-duplicate postings, keeping the first occurrence of each.
+
+    Postings are compared on their estimated Jaccard similarity; LSH banding
+    limits comparisons to postings that share at least one band bucket, so
+    the cost stays close to linear in the number of postings.
+    """
+    if not jobs or len(jobs) < 2:
+        return jobs
+
+    shingle_sets = [job_shingles(job) for job in jobs]
+    indexed = [i for i, shingles in enumerate(shingle_sets) if len(shingles)]
+    if len(indexed) < 2:
+        return jobs
+
+    signatures = MinHasher(num_perm).signatures([shingle_sets[i] for i in indexed])
+    rows = num_perm // bands
+    buckets = [{} for _ in range(bands)]
+    duplicates = set()
+
+    for row, job_index in enumerate(indexed):
+        signature = signatures[row]
+        keys = [signature[band * rows:(band + 1) * rows].tobytes() for band in range(bands)]
+
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(buckets[band].get(key, ()))
+        if candidates:
+            candidate_rows = np.fromiter(candidates, dtype=np.int64)
+            similarity = (signatures[candidate_rows] == signature).mean(axis=1)
+            if similarity.max() >= threshold:
+                duplicates.add(job_index)
+                continue
+
+        # Only kept postings go in the buckets
+        for band, key in enumerate(keys):
+            buckets[band].setdefault(key, []).append(row)
+
+    return [job for i, job in enumerate(jobs) if i not in duplicates]
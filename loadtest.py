@@ -0,0 +1,385 @@
+"""Load testing for the resume analyzer.
+
+Typical run, comparing gunicorn settings against a stub JSearch API:
+
+    python loadtest.py stub --port 8001 --latency 0.3 --error-rate 0.05
+    JOB_CACHE=0 JSEARCH_API_HOST=http://127.0.0.1:8001 gunicorn -w 4 -b 127.0.0.1:8000 app:app
+    python loadtest.py run --url http://127.0.0.1:8000 --stub-url http://127.0.0.1:8001 \
+        --concurrency 16 --duration 60
+
+JOB_CACHE=0 makes every upload call the stub. With the job cache on, almost
+all generated resumes map to a few cached queries and the stub's latency
+and errors barely show. The app renders upstream failures as a page with no
+jobs (HTTP 200), so upstream errors are counted by the stub: it prints the
+requests and 503s it served on exit and at /stats, which `run --stub-url`
+adds to the report.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+
+# Stub JSearch server
+
+def make_stub_handler(latency: float, jitter: float, error_rate: float, jobs_per_page: int,
+                      counts: Counter, counts_lock: threading.Lock):
+    class StubJSearchHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.endswith('/stats'):
+                with counts_lock:
+                    self._send(200, dict(counts))
+                return
+            if not url.path.endswith('/search'):
+                self._send(404, {'error': 'Not found'})
+                return
+
+            time.sleep(max(0.0, random.gauss(latency, jitter)))
+
+            failed = random.random() < error_rate
+            with counts_lock:
+                counts['requests'] += 1
+                counts['errors_503'] += failed
+            if failed:
+                self._send(503, {'error': 'Stub upstream error'})
+                return
+
+            params = parse_qs(url.query)
+            query = params.get('query', ['jobs'])[0]
+            num_pages = int(params.get('num_pages', ['1'])[0])
+            jobs = [{
+                'job_id': f"stub-{i}",
+                'job_title': f"{query.replace(' jobs', '').title()} Developer {i}",
+                'employer_name': f"Stub Employer {i % 7}",
+                'job_city': 'Austin',
+                'job_country': 'US',
+                'job_apply_link': f"https://example.com/jobs/{i}",
+                'job_description': f"Looking for an engineer with {query}."
+            } for i in range(jobs_per_page * num_pages)]
+            self._send(200, {'status': 'OK', 'data': jobs})
+
+        def _send(self, status: int, payload: Dict):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubJSearchHandler
+
+
+def run_stub_server(host: str, port: int, latency: float, jitter: float,
+                    error_rate: float, jobs_per_page: int = 10):
+    counts = Counter(requests=0, errors_503=0)
+    handler = make_stub_handler(latency, jitter, error_rate, jobs_per_page, counts, threading.Lock())
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Stub JSearch API on http://{host}:{port} "
+          f"(latency {latency}s ± {jitter}s, error rate {error_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stub served {counts['requests']} search requests, {counts['errors_503']} answered with 503")
+
+
+# Upload corpus
+
+RESUME_TEMPLATE = """{name}
+{email} | 555-{phone} | Austin, TX | linkedin.com/in/{handle}
+
+Summary
+Software engineer with {years}+ years of experience building web services.
+
+Experience
+Senior Engineer, Example Corp
+Developed {skill} services that reduced latency by {pct}%.
+Led a team of {team} engineers and improved deployment frequency.
+Implemented data pipelines in {skill2} processing {volume} million records daily.
+
+Education
+B.S. Computer Science, State University
+
+Skills
+{skills}
+"""
+
+SKILL_CHOICES = ['python', 'java', 'sql', 'javascript', 'html', 'css', 'mongodb', 'postgresql']
+
+
+def make_resume_text(rng: random.Random) -> str:
+    skills = rng.sample(SKILL_CHOICES, 4)
+    handle = f"user{rng.randint(1000, 9999)}"
+    return RESUME_TEMPLATE.format(
+        name=rng.choice(['Jane Doe', 'John Smith', 'Priya Patel', 'Wei Chen']),
+        email=f"{handle}@example.com",
+        phone=f"{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        handle=handle,
+        years=rng.randint(1, 15),
+        skill=skills[0],
+        skill2=skills[1],
+        pct=rng.randint(10, 60),
+        team=rng.randint(2, 12),
+        volume=rng.randint(1, 50),
+        skills=', '.join(skills)
+    )
+
+
+def make_docx(text: str) -> bytes:
+    import docx
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_corpus(corpus_dir: str = None, size: int = 20, seed: int = 0) -> List[Tuple[str, bytes]]:
+    """Mixed PDF/DOCX/TXT uploads as (filename, content) pairs.
+
+    Files in `corpus_dir` are used as-is; otherwise generated TXT and DOCX
+    resumes are mixed with the bundled Sample_data.pdf.
+    """
+    corpus = []
+    if corpus_dir:
+        for name in sorted(os.listdir(corpus_dir)):
+            if name.rsplit('.', 1)[-1].lower() in ('pdf', 'docx', 'doc', 'txt'):
+                with open(os.path.join(corpus_dir, name), 'rb') as file:
+                    corpus.append((name, file.read()))
+        return corpus
+
+    rng = random.Random(seed)
+    sample_pdf = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Sample_data.pdf')
+    with open(sample_pdf, 'rb') as file:
+        pdf_bytes = file.read()
+
+    for i in range(size):
+        kind = ('pdf', 'docx', 'txt')[i % 3]
+        if kind == 'pdf':
+            corpus.append((f"resume_{i}.pdf", pdf_bytes))
+        elif kind == 'docx':
+            corpus.append((f"resume_{i}.docx", make_docx(make_resume_text(rng))))
+        else:
+            corpus.append((f"resume_{i}.txt", make_resume_text(rng).encode('utf-8')))
+    return corpus
+
+
+# Load driver
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadTest:
+    def __init__(self, url: str, corpus: List[Tuple[str, bytes]], timeout: float = 60):
+        self.analyze_url = url.rstrip('/') + '/analyze'
+        self.corpus = corpus
+        self.timeout = timeout
+        self.results = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _send(self, index: int, started: float):
+        filename, content = self.corpus[index % len(self.corpus)]
+        error = None
+        status = None
+        try:
+            # Each upload is a fresh session so per-session caches are cold
+            session = self._session()
+            session.cookies.clear()
+            # The app saves uploads under their filename, so concurrent requests need unique names
+            response = session.post(self.analyze_url, files={'file': (f"{index}_{filename}", content)},
+                                    allow_redirects=False, timeout=self.timeout)
+            status = response.status_code
+            # The app redirects back to the form when an upload fails
+            if status != 200:
+                error = f"HTTP {status}"
+        except requests.exceptions.RequestException as e:
+            error = type(e).__name__
+        latency = time.perf_counter() - started
+
+        with self._lock:
+            self.results.append({
+                'file_type': filename.rsplit('.', 1)[-1].lower(),
+                'latency': latency,
+                'status': status,
+                'error': error
+            })
+
+    def run_concurrency(self, concurrency: int, duration: float):
+        """Closed loop: `concurrency` clients send back-to-back requests"""
+        deadline = time.perf_counter() + duration
+        counter = iter(range(10 ** 12))
+        counter_lock = threading.Lock()
+
+        def client():
+            while time.perf_counter() < deadline:
+                with counter_lock:
+                    index = next(counter)
+                self._send(index, time.perf_counter())
+
+        threads = [threading.Thread(target=client) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started
+
+    def run_rate(self, rps: float, duration: float, max_in_flight: int = 256):
+        """Open loop: requests are issued at a fixed rate regardless of responses.
+
+        Latency is measured from each request's scheduled start, so queueing
+        behind a saturated server shows up in the percentiles.
+        """
+        interval = 1.0 / rps
+        total = int(rps * duration)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            for index in range(total):
+                scheduled = started + index * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._send, index, scheduled)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float) -> Dict:
+        def summarize(results):
+            latencies = sorted(r['latency'] for r in results)
+            errors = sum(1 for r in results if r['error'])
+            return {
+                'requests': len(results),
+                'errors': errors,
+                'error_rate': round(errors / len(results), 4) if results else 0.0,
+                'p50': round(percentile(latencies, 50), 4),
+                'p95': round(percentile(latencies, 95), 4),
+                'p99': round(percentile(latencies, 99), 4),
+                'max': round(latencies[-1], 4) if latencies else 0.0
+            }
+
+        overall = summarize(self.results)
+        overall['elapsed'] = round(elapsed, 2)
+        overall['throughput'] = round(len(self.results) / elapsed, 2) if elapsed else 0.0
+        overall['by_file_type'] = {
+            file_type: summarize([r for r in self.results if r['file_type'] == file_type])
+            for file_type in sorted({r['file_type'] for r in self.results})
+        }
+        error_kinds = {}
+        for r in self.results:
+            if r['error']:
+                error_kinds[r['error']] = error_kinds.get(r['error'], 0) + 1
+        overall['error_kinds'] = error_kinds
+        return overall
+
+
+def print_report(report: Dict):
+    print("=" * 60)
+    print("LOAD TEST REPORT")
+    print("=" * 60)
+    print(f"Requests:    {report['requests']} in {report['elapsed']}s")
+    print(f"Throughput:  {report['throughput']} req/s")
+    print(f"Error rate:  {report['error_rate']:.2%} ({report['errors']} errors)")
+    print(f"Latency:     p50 {report['p50']}s  p95 {report['p95']}s  "
+          f"p99 {report['p99']}s  max {report['max']}s")
+    print("")
+    print("BY FILE TYPE:")
+    for file_type, stats in report['by_file_type'].items():
+        print(f"   {file_type:<5} n={stats['requests']:<6} p50 {stats['p50']}s  "
+              f"p95 {stats['p95']}s  p99 {stats['p99']}s  errors {stats['error_rate']:.2%}")
+    if report['error_kinds']:
+        print("")
+        print("ERRORS:")
+        for kind, count in sorted(report['error_kinds'].items(), key=lambda item: -item[1]):
+            print(f"   {kind}: {count}")
+    if 'upstream' in report:
+        upstream = report['upstream']
+        print("")
+        print(f"UPSTREAM (stub): {upstream['requests']} search requests, "
+              f"{upstream['errors_503']} answered with 503")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the resume analyzer")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    stub = subparsers.add_parser('stub', help="Run a stub JSearch API server")
+    stub.add_argument('--host', default='127.0.0.1')
+    stub.add_argument('--port', type=int, default=8001)
+    stub.add_argument('--latency', type=float, default=0.3, help="Mean response latency (seconds)")
+    stub.add_argument('--jitter', type=float, default=0.1, help="Latency standard deviation (seconds)")
+    stub.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 503")
+
+    run = subparsers.add_parser('run', help="Drive /analyze with uploads")
+    run.add_argument('--url', default='http://127.0.0.1:5000', help="Base URL of the app")
+    mode = run.add_mutually_exclusive_group()
+    mode.add_argument('--concurrency', type=int, default=8, help="Number of concurrent clients")
+    mode.add_argument('--rps', type=float, help="Target request rate (open loop)")
+    run.add_argument('--duration', type=float, default=30, help="Test duration (seconds)")
+    run.add_argument('--corpus', help="Directory of resumes to upload instead of the generated mix")
+    run.add_argument('--timeout', type=float, default=60)
+    run.add_argument('--json', help="Also write the report as JSON to this path")
+    run.add_argument('--stub-url', help="Base URL of the stub, to report the upstream requests and 503s it served")
+
+    args = parser.parse_args()
+
+    if args.command == 'stub':
+        run_stub_server(args.host, args.port, args.latency, args.jitter, args.error_rate)
+        return
+
+    corpus = build_corpus(args.corpus)
+    if not corpus:
+        print("No uploads in corpus.")
+        return
+
+    def stub_counts():
+        return requests.get(args.stub_url.rstrip('/') + '/stats', timeout=10).json()
+
+    upstream_before = stub_counts() if args.stub_url else None
+    load_test = LoadTest(args.url, corpus, args.timeout)
+    if args.rps:
+        print(f"Sending {args.rps} req/s to {load_test.analyze_url} for {args.duration}s")
+        elapsed = load_test.run_rate(args.rps, args.duration)
+    else:
+        print(f"Running {args.concurrency} clients against {load_test.analyze_url} for {args.duration}s")
+        elapsed = load_test.run_concurrency(args.concurrency, args.duration)
+
+    report = load_test.report(elapsed)
+    if upstream_before is not None:
+        upstream_after = stub_counts()
+        report['upstream'] = {key: upstream_after[key] - upstream_before[key] for key in upstream_after}
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+
+from flask import g, request
+
+
+class SamplingProfiler:
+    """Low-overhead stack sampler for a single thread.
+
+    A background thread snapshots the target thread's stack every `interval`
+    seconds, so the profiled code runs at full speed between samples.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename}:{code.co_firstlineno}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+
+class RequestProfiler:
+    """Opt-in profiling of /analyze requests.
+
+    Configured through the Flask app config:
+        PROFILE_ENABLED         master switch, nothing is profiled when off
+        PROFILE_SAMPLE_RATE     fraction of requests to always capture
+        PROFILE_SLOW_THRESHOLD  capture any request slower than this (seconds)
+        PROFILE_HEADER          request header that forces a capture
+        PROFILE_ALLOW_HEADER    honour PROFILE_HEADER; off by default so clients can't force captures
+        PROFILE_DIR             directory the captures are written to
+        PROFILE_MAX_FILES       oldest captures are removed beyond this count
+        PROFILE_INTERVAL        sampling interval (seconds)
+    """
+
+    defaults = {
+        'PROFILE_ENABLED': False,
+        'PROFILE_SAMPLE_RATE': 0.0,
+        'PROFILE_SLOW_THRESHOLD': None,
+        'PROFILE_HEADER': 'X-Profile-Request',
+        'PROFILE_ALLOW_HEADER': False,
+        'PROFILE_DIR': 'profiles',
+        'PROFILE_MAX_FILES': 100,
+        'PROFILE_INTERVAL': 0.005,
+        'PROFILE_ENDPOINTS': ('analyze',)
+    }
+
+    def __init__(self, app=None):
+        self.app = app
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        for key, value in self.defaults.items():
+            app.config.setdefault(key, value)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def active(self) -> bool:
+        """Whether the current request is being profiled"""
+        return getattr(g, '_profiler', None) is not None
+
+    def annotate(self, **metadata):
+        """Attach metadata (file type, size, pages...) to the current capture"""
+        if self.active():
+            g._profile_metadata.update(metadata)
+
+    def _before_request(self):
+        config = self.app.config
+        if not config['PROFILE_ENABLED'] or request.endpoint not in config['PROFILE_ENDPOINTS']:
+            return
+
+        forced = (config['PROFILE_ALLOW_HEADER']
+                  and request.headers.get(config['PROFILE_HEADER'], '').lower() in ('1', 'true', 'yes'))
+        sampled = random.random() < config['PROFILE_SAMPLE_RATE']
+        if not (forced or sampled or config['PROFILE_SLOW_THRESHOLD'] is not None):
+            return
+
+        g._profile_reason = 'header' if forced else 'sampled' if sampled else None
+        g._profile_metadata = {}
+        g._profile_started = time.perf_counter()
+        g._profiler = SamplingProfiler(threading.get_ident(), config['PROFILE_INTERVAL'])
+        g._profiler.start()
+
+    def _after_request(self, response):
+        if self.active():
+            g._profile_metadata['status'] = response.status_code
+        return response
+
+    def _teardown_request(self, exc):
+        if not self.active():
+            return
+
+        profiler = g.pop('_profiler')
+        profiler.stop()
+        duration = time.perf_counter() - g._profile_started
+
+        reason = g._profile_reason
+        threshold = self.app.config['PROFILE_SLOW_THRESHOLD']
+        if reason is None and threshold is not None and duration >= threshold:
+            reason = 'slow'
+        if reason is None:
+            return
+
+        metadata = dict(g._profile_metadata)
+        metadata.update({
+            'method': request.method,
+            'path': request.path,
+            'reason': reason,
+            'duration': round(duration, 4),
+            'timestamp': time.time(),
+            'error': repr(exc) if exc is not None else None
+        })
+
+        try:
+            self._write_capture(metadata, profiler)
+        except OSError as e:
+            self.app.logger.warning(f"Could not write profile capture: {e}")
+
+    def _write_capture(self, metadata: Dict, profiler: SamplingProfiler):
+        directory = self.app.config['PROFILE_DIR']
+        os.makedirs(directory, exist_ok=True)
+
+        capture = {
+            'metadata': metadata,
+            'interval': profiler.interval,
+            'samples': [{'stack': list(stack), 'count': count}
+                        for stack, count in profiler.samples.most_common()]
+        }
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.json"
+        with open(os.path.join(directory, filename), 'w') as file:
+            json.dump(capture, file)
+
+        # Rotate: keep only the newest captures
+        captures = sorted(list_captures(directory), key=os.path.getmtime)
+        for path in captures[:max(0, len(captures) - self.app.config['PROFILE_MAX_FILES'])]:
+            os.remove(path)
+
+
+def list_captures(directory: str) -> List[str]:
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.json')]
+
+
+def aggregate_captures(paths: List[str]) -> Dict:
+    """Sum self and inclusive sample counts per function across captures"""
+    self_counts = Counter()
+    total_counts = Counter()
+    total_samples = 0
+
+    for path in paths:
+        with open(path) as file:
+            capture = json.load(file)
+        for sample in capture['samples']:
+            stack = sample['stack']
+            count = sample['count']
+            total_samples += count
+            self_counts[stack[-1]] += count
+            for function in set(stack):
+                total_counts[function] += count
+
+    return {
+        'captures': len(paths),
+        'samples': total_samples,
+        'self': self_counts,
+        'total': total_counts
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the hottest functions across profile captures")
+    parser.add_argument('directory', nargs='?', default='profiles', help="Directory with profile captures")
+    parser.add_argument('--top', type=int, default=20, help="Number of functions to show")
+    parser.add_argument('--sort', choices=['self', 'total'], default='self',
+                        help="Rank by samples in the function itself or including callees")
+    args = parser.parse_args()
+
+    paths = list_captures(args.directory)
+    if not paths:
+        print(f"No profile captures found in {args.directory}")
+        return
+
+    stats = aggregate_captures(paths)
+    print(f"{stats['captures']} captures, {stats['samples']} samples")
+    print(f"{'self %':>8} {'total %':>8}  function")
+    for function, _ in stats[args.sort].most_common(args.top):
+        self_pct = 100 * stats['self'][function] / stats['samples']
+        total_pct = 100 * stats['total'][function] / stats['samples']
+        print(f"{self_pct:8.1f} {total_pct:8.1f}  {function}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+from Job_recommender import extract_skills, extract_experience
+
+
+class SectionCache:
+    """Per-session cache of section-level analysis results.
+
+    Users tend to re-upload the same resume with small edits. Each section is
+    keyed by a hash of its content, so only sections that changed since the
+    previous upload in the same session are re-analysed; the per-section
+    results are then recombined into the overall ATS score.
+    """
+
+    def __init__(self, ats_checker, max_sessions: int = 256):
+        self.ats_checker = ats_checker
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _section_key(self, section_text: str) -> str:
+        return hashlib.sha256(section_text.encode('utf-8')).hexdigest()
+
+    def _analyze_section(self, section_text: str) -> Dict:
+        signals = self.ats_checker.analyze_section(section_text)
+        signals['skills'] = extract_skills(section_text)
+        signals['experience'] = extract_experience(section_text)
+        return signals
+
+    def analyze(self, session_id: str, resume_text: str, filename: str = "") -> Dict:
+        """Analyse a resume, reusing cached results for unchanged sections"""
+        with self._lock:
+            cached = self._sessions.get(session_id, {})
+
+        sections = self.ats_checker.split_into_sections(resume_text)
+        results = {}
+        section_signals = []
+        reused = 0
+        for section_text in sections:
+            key = self._section_key(section_text)
+            if key in results:
+                signals = results[key]
+            elif key in cached:
+                signals = cached[key]
+                reused += 1
+            else:
+                signals = self._analyze_section(section_text)
+            results[key] = signals
+            section_signals.append(signals)
+
+        # Only the current upload's sections are kept for the next comparison
+        with self._lock:
+            self._sessions[session_id] = results
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+        skills = set()
+        for signals in section_signals:
+            skills.update(signals['skills'])
+
+        return {
+            'ats_results': self.ats_checker.calculate_ats_score_from_sections(
+                resume_text, section_signals, filename),
+            'skills': list(skills),
+            'experience': max(signals['experience'] for signals in section_signals),
+            'sections_total': len(sections),
+            'sections_reused': reused
+        }
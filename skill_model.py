@@ -0,0 +1,149 @@
+import argparse
+import json
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class SkillCooccurrenceModel:
+    """Related-skill lookups from skill co-occurrence in job postings.
+
+    The model is a sparse skill x skill matrix in CSR form (indptr, indices,
+    data) where row `a` holds P(b | a) for the skills `b` most often listed
+    alongside `a`. It is trained offline and the arrays are memory-mapped at
+    load time, so a lookup only touches the rows of the resume's skills.
+    """
+
+    def __init__(self, skills: List[str], indptr: np.ndarray, indices: np.ndarray, data: np.ndarray):
+        self.skills = skills
+        self.skill_index = {skill: i for i, skill in enumerate(skills)}
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def train(cls, postings: Iterable[Dict], vocabulary: List[str],
+              max_related: int = 50) -> 'SkillCooccurrenceModel':
+        """Count skill pairs per posting and keep the top related skills per row"""
+        skills = sorted({skill.lower() for skill in vocabulary})
+        skill_index = {skill: i for i, skill in enumerate(skills)}
+        # Boundaries that also work for skills like c++ and c#
+        pattern = re.compile(r'(?<![\w+#])(' + '|'.join(re.escape(s) for s in
+                             sorted(skills, key=len, reverse=True)) + r')(?![\w+#])')
+
+        skill_counts = Counter()
+        pair_counts = Counter()
+        for posting in postings:
+            text = ' '.join(str(posting.get(field) or '') for field in ('job_title', 'job_description'))
+            found = sorted({skill_index[m] for m in pattern.findall(text.lower())})
+            skill_counts.update(found)
+            for i, a in enumerate(found):
+                for b in found[i + 1:]:
+                    pair_counts[(a, b)] += 1
+
+        rows = [[] for _ in skills]
+        for (a, b), count in pair_counts.items():
+            rows[a].append((b, count / skill_counts[a]))
+            rows[b].append((a, count / skill_counts[b]))
+
+        indptr = [0]
+        indices = []
+        data = []
+        for row in rows:
+            row.sort(key=lambda item: -item[1])
+            row = row[:max_related]
+            indices.extend(b for b, _ in row)
+            data.extend(weight for _, weight in row)
+            indptr.append(len(indices))
+
+        return cls(skills,
+                   np.array(indptr, dtype=np.int64),
+                   np.array(indices, dtype=np.int32),
+                   np.array(data, dtype=np.float32))
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'skills.json'), 'w') as file:
+            json.dump(self.skills, file)
+        np.save(os.path.join(directory, 'indptr.npy'), self.indptr)
+        np.save(os.path.join(directory, 'indices.npy'), self.indices)
+        np.save(os.path.join(directory, 'data.npy'), self.data)
+
+    @classmethod
+    def load(cls, directory: str) -> 'SkillCooccurrenceModel':
+        with open(os.path.join(directory, 'skills.json')) as file:
+            skills = json.load(file)
+        return cls(skills,
+                   np.load(os.path.join(directory, 'indptr.npy'), mmap_mode='r'),
+                   np.load(os.path.join(directory, 'indices.npy'), mmap_mode='r'),
+                   np.load(os.path.join(directory, 'data.npy'), mmap_mode='r'))
+
+    def related(self, skills: List[str], k: int = 5) -> List[Tuple[str, float]]:
+        """Top-k skills related to the given ones, excluding skills already present"""
+        rows = [self.skill_index[skill.lower()] for skill in skills if skill.lower() in self.skill_index]
+        if not rows:
+            return []
+
+        indices = np.concatenate([self.indices[self.indptr[r]:self.indptr[r + 1]] for r in rows])
+        weights = np.concatenate([self.data[self.indptr[r]:self.indptr[r + 1]] for r in rows])
+        keep = ~np.isin(indices, rows)
+        indices, weights = indices[keep], weights[keep]
+        if not len(indices):
+            return []
+
+        # Sum the weights a candidate gets from each of the resume's skills
+        candidates, inverse = np.unique(indices, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights)
+
+        top = np.argpartition(-scores, k)[:k] if len(scores) > k else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.skills[candidates[i]], round(float(scores[i]), 3)) for i in top]
+
+
+def load_postings(path: str) -> List[Dict]:
+    """Load postings from a JSON/JSONL file or a directory of them.
+
+    Saved JSearch responses ({"data": [...]}) are accepted as well.
+    """
+    paths = [os.path.join(path, name) for name in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+    postings = []
+    for file_path in paths:
+        if file_path.endswith('.jsonl'):
+            with open(file_path) as file:
+                postings.extend(json.loads(line) for line in file if line.strip())
+        elif file_path.endswith('.json'):
+            with open(file_path) as file:
+                content = json.load(file)
+            if isinstance(content, dict):
+                content = content.get('data') or []
+            postings.extend(content)
+    return postings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the skill co-occurrence model from job postings")
+    parser.add_argument('postings', help="JSON/JSONL file or directory of job postings")
+    parser.add_argument('--output', default=os.path.join('models', 'skills'), help="Model directory")
+    parser.add_argument('--skills', help="File with one skill per line (defaults to SKILLS_DB)")
+    parser.add_argument('--max-related', type=int, default=50, help="Related skills kept per skill")
+    args = parser.parse_args()
+
+    if args.skills:
+        with open(args.skills) as file:
+            vocabulary = [line.strip() for line in file if line.strip()]
+    else:
+        from Job_recommender import SKILLS_DB
+        vocabulary = SKILLS_DB
+
+    postings = load_postings(args.postings)
+    model = SkillCooccurrenceModel.train(postings, vocabulary, args.max_related)
+    model.save(args.output)
+    print(f"Trained on {len(postings)} postings: {len(model.skills)} skills, "
+          f"{len(model.indices)} related pairs saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import threading
+import time
+import types
+
+import pytest
+
+# job_cache imports Job_recommender, which loads the separately downloaded spaCy model
+try:
+    import job_cache
+    from job_cache import JobSearchCache
+except (ImportError, OSError) as e:
+    pytest.skip(f"Job_recommender dependencies not available: {e}", allow_module_level=True)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeUpstream:
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, query, api_key):
+        self.calls.append(query)
+        if self.fail:
+            return None
+        return [{'job_title': f"{query} #{len(self.calls)}"}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(job_cache, 'time', types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    upstream = FakeUpstream()
+    monkeypatch.setattr(job_cache, 'fetch_jobs', upstream)
+    return upstream
+
+
+def test_hits_misses_and_api_calls(clock, upstream):
+    cache = JobSearchCache(ttl=60)
+
+    first = cache.get('python jobs', 'key')
+    assert cache.get('python jobs', 'key') == first
+    cache.get('java jobs', 'key')
+
+    stats = cache.stats()
+    assert upstream.calls == ['python jobs', 'java jobs']
+    assert (stats['hits'], stats['misses'], stats['request_api_calls']) == (1, 2, 2)
+    assert stats['hit_rate'] == 0.333
+    assert stats['warmer_api_calls'] == 0
+
+
+def test_expired_results_are_refetched(clock, upstream):
+    cache = JobSearchCache(ttl=60)
+    first = cache.get('python jobs', 'key')
+
+    clock.now += 61
+    second = cache.get('python jobs', 'key')
+
+    assert second != first
+    assert len(upstream.calls) == 2
+
+
+def test_failed_fetch_is_not_cached_and_stale_results_are_served(clock, upstream):
+    cache = JobSearchCache(ttl=60)
+
+    upstream.fail = True
+    assert cache.get('python jobs', 'key') is None
+    upstream.fail = False
+    fresh = cache.get('python jobs', 'key')
+    assert fresh is not None
+
+    clock.now += 61
+    upstream.fail = True
+    assert cache.get('python jobs', 'key') == fresh
+    assert cache.stats()['stale_served'] == 1
+
+
+def test_concurrent_misses_fetch_once(upstream, monkeypatch):
+    cache = JobSearchCache(ttl=60)
+    release = threading.Event()
+
+    def slow_fetch(query, api_key):
+        release.wait(5)
+        return upstream(query, api_key)
+
+    monkeypatch.setattr(job_cache, 'fetch_jobs', slow_fetch)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('python jobs', 'key')))
+               for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    # Let every thread reach the cache before the single fetch completes
+    deadline = time.time() + 5
+    while cache.stats()['misses'] < 10 and time.time() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert upstream.calls == ['python jobs']
+    assert len(results) == 10 and all(result == results[0] for result in results)
+    assert cache.stats()['coalesced'] == 9
+
+
+def test_warm_skips_queries_nobody_requested(clock, upstream):
+    cache = JobSearchCache(ttl=60, refresh_margin=10)
+
+    assert cache.warm('key') == 0
+    assert upstream.calls == []
+
+
+def test_warm_refreshes_only_queries_close_to_expiry(clock, upstream):
+    cache = JobSearchCache(ttl=60, refresh_margin=10)
+    cache.get('python jobs', 'key')
+
+    clock.now += 30
+    assert cache.warm('key') == 0
+
+    clock.now += 25
+    assert cache.warm('key') == 1
+    assert cache.stats()['warmer_api_calls'] == 1
+
+    # Refreshed just before expiry, so the next request is still a hit
+    clock.now += 10
+    cache.get('python jobs', 'key')
+    assert cache.stats()['hits'] == 1
+
+
+def test_queries_not_requested_within_ttl_are_forgotten(clock, upstream):
+    cache = JobSearchCache(ttl=60, refresh_margin=10)
+    cache.get('python jobs', 'key')
+
+    clock.now += 61
+    assert cache.warm('key') == 0
+    stats = cache.stats()
+    assert stats['top_queries'] == []
+    assert stats['cached_queries'] == 0
+
+
+def test_popularity_decays(clock, upstream):
+    cache = JobSearchCache(ttl=600, top_n=1, half_life=10)
+    for _ in range(3):
+        cache.get('java jobs', 'key')
+
+    # Three requests 30s (three half-lives) ago are worth less than one now
+    clock.now += 30
+    cache.get('python jobs', 'key')
+
+    assert cache.stats()['top_queries'] == [('python jobs', 1.0)]
@@ -0,0 +1,70 @@
+from job_dedup import deduplicate_jobs
+
+
+DESCRIPTION = ("We are hiring a backend engineer to build and operate python services on a postgresql data "
+               "platform. You will design rest apis, review code, mentor junior engineers and improve the "
+               "deployment pipelines used across several product teams. The role includes owning monitoring "
+               "and alerting, taking part in a shared on call rotation, writing clear design documents and "
+               "working closely with product managers to plan quarterly roadmaps. Experience with docker, "
+               "kubernetes and aws is a plus, and we offer flexible remote work, a learning budget and "
+               "generous parental leave. Our engineering organisation values small pull requests, automated "
+               "tests and blameless incident reviews, and every engineer spends part of each quarter on "
+               "reliability work and paying down technical debt.")
+
+
+def make_job(job_id, title, employer, description):
+    return {'job_id': job_id, 'job_title': title, 'employer_name': employer,
+            'job_description': description}
+
+
+def test_exact_repost_is_dropped_and_order_kept():
+    jobs = [
+        make_job('a', 'Python Developer', 'Acme', DESCRIPTION),
+        make_job('b', 'Frontend Engineer', 'Globex',
+                 "Build accessible react interfaces with css and html for a retail storefront"),
+        # Same posting from another board
+        make_job('c', 'Python Developer', 'Acme', DESCRIPTION),
+        make_job('d', 'Data Analyst', 'Initech',
+                 "Analyse sales data in sql and present weekly dashboards to finance leadership"),
+    ]
+
+    assert [job['job_id'] for job in deduplicate_jobs(jobs)] == ['a', 'b', 'd']
+
+
+def test_lightly_edited_repost_is_dropped():
+    # Board suffix in the title and two changed words: Jaccard similarity ~0.87
+    repost = DESCRIPTION.replace('several', 'multiple').replace('generous', 'paid')
+    jobs = [
+        make_job('a', 'Python Developer', 'Acme', DESCRIPTION),
+        make_job('b', 'Python Developer (Remote)', 'Acme', repost),
+    ]
+
+    assert [job['job_id'] for job in deduplicate_jobs(jobs)] == ['a']
+
+
+def test_posting_just_under_threshold_is_kept():
+    # Five changed words: Jaccard similarity ~0.77, below the 0.8 threshold
+    edited = (DESCRIPTION.replace('operate', 'run').replace('junior', 'new').replace('shared', 'weekly')
+              .replace('flexible', 'hybrid').replace('small', 'focused'))
+    jobs = [
+        make_job('a', 'Python Developer', 'Acme', DESCRIPTION),
+        make_job('b', 'Python Developer', 'Acme', edited),
+    ]
+
+    assert deduplicate_jobs(jobs) == jobs
+
+
+def test_distinct_postings_are_kept():
+    jobs = [
+        make_job('a', 'Python Developer', 'Acme', DESCRIPTION),
+        make_job('b', 'Java Developer', 'Umbrella',
+                 "Maintain java microservices for payments, handle on call rotations and write tests"),
+    ]
+
+    assert deduplicate_jobs(jobs) == jobs
+
+
+def test_postings_without_text_are_kept():
+    jobs = [make_job('a', None, None, None), make_job('b', None, None, None)]
+
+    assert deduplicate_jobs(jobs) == jobs
@@ -0,0 +1,59 @@
+import pytest
+
+# Job_recommender loads the separately downloaded spaCy model on import
+try:
+    import Job_recommender
+    from Job_recommender import build_job_query
+except (ImportError, OSError) as e:
+    pytest.skip(f"Job_recommender dependencies not available: {e}", allow_module_level=True)
+
+
+def test_target_skill_is_picked_in_target_skills_order():
+    assert build_job_query(['sql', 'python', 'java']) == "java jobs"
+    assert build_job_query(['python', 'sql']) == "python jobs"
+    assert build_job_query(['SQL', 'css']) == "sql jobs"
+
+
+def test_query_does_not_depend_on_skill_order():
+    skills = ['mongodb', 'html', 'css']
+
+    assert build_job_query(skills) == "css html mongodb jobs"
+    assert build_job_query(list(reversed(skills))) == "css html mongodb jobs"
+
+
+class FakeFetch:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = []
+
+    def __call__(self, query, api_key):
+        self.queries.append(query)
+        return self.results.pop(0)
+
+
+def test_empty_results_retry_once_with_closest_related_skill(monkeypatch):
+    fetch = FakeFetch([], [])
+    monkeypatch.setattr(Job_recommender, 'fetch_jobs', fetch)
+
+    jobs = Job_recommender.search_jobs(['cobol'], 5, api_key='key', related_skills=['fortran', 'pascal'])
+
+    assert jobs == []
+    assert fetch.queries == ["cobol jobs", "fortran jobs"]
+
+
+def test_api_error_is_not_retried(monkeypatch):
+    fetch = FakeFetch(None)
+    monkeypatch.setattr(Job_recommender, 'fetch_jobs', fetch)
+
+    assert Job_recommender.search_jobs(['cobol'], 5, api_key='key', related_skills=['fortran']) is None
+    assert fetch.queries == ["cobol jobs"]
+
+
+def test_non_empty_results_are_not_broadened(monkeypatch):
+    fetch = FakeFetch([{'job_title': 'COBOL Developer'}])
+    monkeypatch.setattr(Job_recommender, 'fetch_jobs', fetch)
+
+    jobs = Job_recommender.search_jobs(['cobol'], 5, api_key='key', related_skills=['fortran'])
+
+    assert jobs == [{'job_title': 'COBOL Developer'}]
+    assert fetch.queries == ["cobol jobs"]
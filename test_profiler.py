@@ -0,0 +1,123 @@
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('flask')
+
+from flask import Flask
+
+import profiler
+from profiler import RequestProfiler, aggregate_captures, list_captures
+
+
+def make_app(tmp_path, **config):
+    app = Flask(__name__)
+    app.config.update({'PROFILE_ENABLED': True, 'PROFILE_DIR': str(tmp_path / 'profiles'), **config})
+    request_profiler = RequestProfiler(app)
+
+    @app.route('/analyze', methods=['POST'])
+    def analyze():
+        request_profiler.annotate(file_type='txt')
+        return 'ok'
+
+    @app.route('/')
+    def index():
+        return 'ok'
+
+    return app
+
+
+def read_captures(app):
+    captures = []
+    for path in list_captures(app.config['PROFILE_DIR']):
+        with open(path) as file:
+            captures.append(json.load(file))
+    return captures
+
+
+def write_capture(directory, samples):
+    path = os.path.join(directory, f"capture-{len(os.listdir(directory))}.json")
+    with open(path, 'w') as file:
+        json.dump({'metadata': {}, 'interval': 0.005,
+                   'samples': [{'stack': stack, 'count': count} for stack, count in samples]}, file)
+    return path
+
+
+def test_header_is_ignored_unless_allowed(tmp_path):
+    app = make_app(tmp_path)
+    app.test_client().post('/analyze', headers={'X-Profile-Request': '1'})
+    assert read_captures(app) == []
+
+    app = make_app(tmp_path, PROFILE_ALLOW_HEADER=True)
+    app.test_client().post('/analyze', headers={'X-Profile-Request': '1'})
+    [capture] = read_captures(app)
+    assert capture['metadata']['reason'] == 'header'
+    assert capture['metadata']['file_type'] == 'txt'
+    assert capture['metadata']['status'] == 200
+
+
+def test_sampled_request_is_captured(tmp_path):
+    app = make_app(tmp_path, PROFILE_SAMPLE_RATE=1.0)
+    app.test_client().post('/analyze')
+
+    [capture] = read_captures(app)
+    assert capture['metadata']['reason'] == 'sampled'
+
+
+def test_slow_request_is_captured(tmp_path):
+    app = make_app(tmp_path, PROFILE_SLOW_THRESHOLD=0)
+    app.test_client().post('/analyze')
+
+    [capture] = read_captures(app)
+    assert capture['metadata']['reason'] == 'slow'
+
+
+def test_nothing_is_captured_without_a_trigger(tmp_path):
+    app = make_app(tmp_path)
+    app.test_client().post('/analyze')
+    assert read_captures(app) == []
+
+    app = make_app(tmp_path, PROFILE_ENABLED=False, PROFILE_SAMPLE_RATE=1.0)
+    app.test_client().post('/analyze')
+    assert read_captures(app) == []
+
+    app = make_app(tmp_path, PROFILE_SAMPLE_RATE=1.0)
+    app.test_client().get('/')
+    assert read_captures(app) == []
+
+
+@pytest.mark.parametrize('max_files', [2, 0])
+def test_oldest_captures_are_rotated(tmp_path, max_files):
+    app = make_app(tmp_path, PROFILE_SAMPLE_RATE=1.0, PROFILE_MAX_FILES=max_files)
+    client = app.test_client()
+    for _ in range(4):
+        client.post('/analyze')
+
+    assert len(read_captures(app)) == max_files
+
+
+def test_aggregate_counts_self_and_total_samples(tmp_path):
+    write_capture(str(tmp_path), [(['main', 'analyze', 'parse'], 3), (['main', 'analyze'], 1)])
+    # Recursive stack: 'walk' is on the stack twice but was only running in 2 samples
+    write_capture(str(tmp_path), [(['main', 'walk', 'walk', 'parse'], 2)])
+
+    stats = aggregate_captures(list_captures(str(tmp_path)))
+
+    assert (stats['captures'], stats['samples']) == (2, 6)
+    assert stats['self'] == {'parse': 5, 'analyze': 1}
+    assert stats['total'] == {'main': 6, 'analyze': 4, 'parse': 5, 'walk': 2}
+
+
+def test_cli_ranks_functions(tmp_path, monkeypatch, capsys):
+    write_capture(str(tmp_path), [(['main', 'analyze', 'parse'], 3), (['main', 'analyze'], 1)])
+
+    monkeypatch.setattr(sys, 'argv', ['profiler.py', str(tmp_path), '--top', '2'])
+    profiler.main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "1 captures, 4 samples"
+    assert lines[2].split() == ['75.0', '75.0', 'parse']
+    assert lines[3].split() == ['25.0', '100.0', 'analyze']
+    assert len(lines) == 4
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+pytest.importorskip('nltk')
+pytest.importorskip('textstat')
+pytest.importorskip('spacy')
+pytest.importorskip('pdfplumber')
+
+# The spaCy model and nltk data are downloaded separately from the packages
+try:
+    from Ats import UniversalATSChecker
+    from section_cache import SectionCache
+    UniversalATSChecker()
+except (OSError, LookupError) as e:
+    pytest.skip(f"spaCy model or nltk data not available: {e}", allow_module_level=True)
+
+
+BULLET_RESUME = """Sam Lee
+sam@example.com | 555-222-3333 | Denver, CO
+
+Experience
+Staff Engineer, Example Corp
+• Increased throughput by 35%
+• Reduced cloud spend by $200k
+• Led a team of 6 engineers
+
+Education
+B.S. Computer Science, State University
+
+Skills
+• Built 4 internal tools
+Python, SQL, Java
+"""
+
+
+@pytest.fixture(scope='module')
+def checker():
+    return UniversalATSChecker()
+
+
+def sample_pdf_text(checker):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Sample_data.pdf')
+    return checker.extract_text_from_file(path)
+
+
+@pytest.mark.parametrize('source', ['sample_pdf', 'bullets'])
+def test_section_scores_match_full_text(checker, source):
+    text = sample_pdf_text(checker) if source == 'sample_pdf' else BULLET_RESUME
+    filename = 'resume.pdf' if source == 'sample_pdf' else 'resume.txt'
+
+    analysis = SectionCache(checker).analyze('session', text, filename)
+
+    assert analysis['ats_results'] == checker.calculate_overall_ats_score(text, filename)
+
+
+def test_reupload_only_reanalyses_changed_sections(checker):
+    cache = SectionCache(checker)
+    first = cache.analyze('session', BULLET_RESUME, 'resume.txt')
+    edited = BULLET_RESUME.replace('Reduced cloud spend by $200k', 'Reduced cloud spend by $300k')
+    second = cache.analyze('session', edited, 'resume.txt')
+
+    assert first['sections_reused'] == 0
+    assert second['sections_reused'] == second['sections_total'] - 1
+    assert second['ats_results'] == checker.calculate_overall_ats_score(edited, 'resume.txt')
@@ -0,0 +1,39 @@
+from skill_model import SkillCooccurrenceModel
+
+
+VOCABULARY = ['python', 'java', 'c++', 'c#', 'javascript', 'html', 'css', 'sql', 'postgresql', 'mongodb']
+
+POSTINGS = [
+    {'job_title': 'Backend Engineer', 'job_description': 'python, sql and postgresql'},
+    {'job_title': 'Data Engineer', 'job_description': 'python with sql and mongodb'},
+    {'job_title': 'Web Developer', 'job_description': 'javascript, html and css'},
+    {'job_title': 'Frontend Developer', 'job_description': 'html and css, some javascript'},
+    {'job_title': 'Systems Engineer', 'job_description': 'c++ and c#, javascript is not enough'},
+]
+
+
+def test_related_skills_are_ranked_and_exclude_known_skills():
+    model = SkillCooccurrenceModel.train(POSTINGS, VOCABULARY)
+
+    assert model.related(['python'], k=1) == [('sql', 1.0)]
+    assert dict(model.related(['python'])) == {'sql': 1.0, 'mongodb': 0.5, 'postgresql': 0.5}
+    assert [skill for skill, _ in model.related(['html', 'css'])] == ['javascript']
+    assert model.related(['cobol']) == []
+
+
+def test_skill_boundaries_do_not_match_inside_other_skills():
+    model = SkillCooccurrenceModel.train(POSTINGS, VOCABULARY)
+
+    # "javascript" must not count as "java", nor "c++" as "c#"
+    assert model.related(['java']) == []
+    assert {skill for skill, _ in model.related(['c++'])} == {'c#', 'javascript'}
+
+
+def test_saved_model_is_memory_mapped(tmp_path):
+    model = SkillCooccurrenceModel.train(POSTINGS, VOCABULARY)
+    model.save(str(tmp_path))
+
+    loaded = SkillCooccurrenceModel.load(str(tmp_path))
+
+    assert loaded.data.filename is not None
+    assert loaded.related(['python', 'sql']) == model.related(['python', 'sql'])